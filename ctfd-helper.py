@@ -1,59 +1,431 @@
 #!/usr/bin/env python3
 
 import os
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, abort, g, jsonify, request
+from werkzeug.security import safe_join
+import bisect
+import contextlib
 import json
 from datetime import datetime
-import requests
-import webbrowser
+import gzip
+import hashlib
+import hmac
+import importlib
+import mimetypes
+import shutil
 import sys
+import time
+import re
+import math
+import secrets
+import threading
+import unicodedata
+import uuid
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+class _LazyModule:
+    """Imports a module on its first attribute access. Unlike importlib's LazyLoader
+    (before Python 3.12), concurrent first accesses from several threads are safe."""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+    def __getattr__(self, attr):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+requests = _LazyModule('requests')
 
 app = Flask(__name__)
 DATA_DIR = 'data'
+# Team mode (--team): one instance serves the whole team, candidate flags are kept per browser
+TEAM_MODE = False
+USER_COOKIE = 'ctfd_helper_user'
+# Shared team secret (--team-secret): required for the routes below, which manage CTFs and
+# their credentials. Opening /?secret=<secret> once stores it in a cookie.
+TEAM_SECRET = None
+TEAM_SECRET_COOKIE = 'ctfd_helper_secret'
+_TEAM_ADMIN_ENDPOINTS = {'create_ctf', 'delete_ctf', 'update_ctf_credentials', 'update_ctf_token', 'get_ctfd_title'}
+# Never sent to the browsers in team mode
+_SECRET_FIELDS = ('password', 'token')
+# Hackropole archive (see misc/dump_hackropole.py) and its similarity index
+HACKROPOLE_URL = 'https://hackropole.fr/fr/challenges/'
+HACKROPOLE_DUMP = os.path.join(DATA_DIR, 'hackropole_dump.jsonl')
+SIMILARITY_INDEX = os.path.join(DATA_DIR, 'hackropole_index.json')
+
+# Match both single and double quotes, allow whitespace/newlines
+_CSRF_NONCE_RE = re.compile(r"['\"]csrfNonce['\"]\s*:\s*['\"]([a-fA-F0-9]{64})['\"]")
+_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.IGNORECASE | re.DOTALL)
 
 if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
     FRONTEND_DIR = os.path.join(sys._MEIPASS, 'build')
 else:
     FRONTEND_DIR = 'build'
 
-# CTF data cache
-_ctf_data_cache = {'ctf_id': None, 'data': None}
+# CTF data cache: {ctf_id: data}, shared by all the users in team mode
+_ctf_data_cache = {}
+_ctf_data_lock = threading.RLock()
+# What this process last read or wrote for each CTF file:
+# {ctf_id: (file signature, {key: digest}, details versions)}.
+# It is the common base of the merge when another process (a sync next to the server) saved the
+# file meanwhile: see _merge_ctf_file.
+_ctf_data_base = {}
+# Keys saved and merged as a single unit: solves hold indexes into the accounts table
+_CTF_DATA_UNITS = (('solves', 'solve_accounts'), ('details_version', 'details_versions'))
+# Exclusive lock on DATA_DIR between processes, reentrant within a process
+_data_dir_lock_state = {'lock': threading.RLock(), 'depth': 0, 'file': None}
+
+@contextlib.contextmanager
+def _data_dir_lock():
+    """Serializes the writers of DATA_DIR files, across threads and processes (flock on
+    DATA_DIR/.lock; without fcntl, e.g. on Windows, only the threads of this process)."""
+    state = _data_dir_lock_state
+    with state['lock']:
+        if state['depth'] == 0:
+            state['file'] = open(os.path.join(DATA_DIR, '.lock'), 'a')
+            if fcntl is not None:
+                fcntl.flock(state['file'], fcntl.LOCK_EX)
+        state['depth'] += 1
+        try:
+            yield
+        finally:
+            state['depth'] -= 1
+            if state['depth'] == 0:
+                state['file'].close()  # Releases the flock
+                state['file'] = None
+
+def _ctf_filename(ctf_id):
+    return os.path.join(DATA_DIR, f"ctf_{ctf_id}.json")
+
+def _file_signature(filename):
+    """(inode, mtime, size) of a file, None if it does not exist. Each save gets a later mtime
+    than the previous one (see update_ctf_cache), even with a coarse clock or a reused inode."""
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return _stat_signature(st)
+
+def _stat_signature(st):
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+def _digest(serialized):
+    return hashlib.sha1(serialized.encode()).digest()
+
+def _read_ctf_file(ctf_id):
+    """Returns (data, file signature) of a CTF file."""
+    filename = _ctf_filename(ctf_id)
+    with open(filename, 'r') as f:
+        signature = _stat_signature(os.fstat(f.fileno()))  # Of the file actually read
+        data = json.load(f)
+    _compact_solves(ctf_id, data)
+    return data, signature
+
+def _merge_ctf_file(ctf_id, ctf_data):
+    """Merges into ctf_data, in place, what another process saved to the CTF file since this process
+    last read or wrote it. Keys changed on a single side keep that side's value. Keys changed on both
+    sides keep ours, except hint contents (union) and details versions, which are renumbered so that
+    /challenges/<ctf_id>/details reports the challenges changed by the other process. Call with
+    _ctf_data_lock held."""
+    base = _ctf_data_base.get(ctf_id)
+    signature = _file_signature(_ctf_filename(ctf_id))
+    if base is None or signature is None or signature == base[0]:
+        return
+    try:
+        disk, signature = _read_ctf_file(ctf_id)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: reading CTF #{ctf_id} data saved by another process: {e}")
+        return
+    base_digests = base[1]
+    theirs = {k: _digest(json.dumps(v)) for k, v in disk.items()}
+    ours = {k: _digest(json.dumps(v)) for k, v in ctf_data.items()}
+    grouped = {k for unit in _CTF_DATA_UNITS for k in unit}
+    units = list(_CTF_DATA_UNITS) + [(k,) for k in set(theirs) | set(ours) if k not in grouped]
+    for unit in units:
+        changed_by_them = any(theirs.get(k) != base_digests.get(k) for k in unit)
+        changed_by_us = any(ours.get(k) != base_digests.get(k) for k in unit)
+        if not changed_by_them:
+            continue
+        if unit[0] == 'details_version':
+            # Even if both sides ended up with the same numbers, they are not the same changes
+            ours_versions = ctf_data.setdefault('details_versions', {})
+            version = max(ctf_data.get('details_version', 0), disk.get('details_version', 0))
+            for chall_key, v in (disk.get('details_versions') or {}).items():
+                if base[2].get(chall_key) != v:
+                    version += 1
+                    ours_versions[chall_key] = version
+            ctf_data['details_version'] = version
+        elif all(theirs.get(k) == ours.get(k) for k in unit):
+            continue
+        elif not changed_by_us:
+            for k in unit:
+                if k in disk:
+                    ctf_data[k] = disk[k]
+                else:
+                    ctf_data.pop(k, None)
+        elif unit[0] == 'hint_contents' and isinstance(ctf_data.get('hint_contents'), dict):
+            for chall_key, hints in (disk.get('hint_contents') or {}).items():
+                ctf_data['hint_contents'][chall_key] = dict(hints, **ctf_data['hint_contents'].get(chall_key, {}))
+    # The file is now the common base: our own changes are still to be saved
+    _ctf_data_base[ctf_id] = (signature, theirs, dict(disk.get('details_versions') or {}))
 
 def load_ctf_cache(ctf_id):
-    """Loads CTF data from a JSON file, caching the last opened file.
-    If ctf_id changes, reload from file."""
-    global _ctf_data_cache
-    if _ctf_data_cache['ctf_id'] == ctf_id and _ctf_data_cache['data']:
-        return _ctf_data_cache['data']
-    filename = os.path.join(DATA_DIR, f"ctf_{ctf_id}.json")
+    """Loads CTF data from a JSON file, keeping it in memory for the next calls.
+    Changes saved to the file by another process meanwhile are merged in (see _merge_ctf_file)."""
+    data = _ctf_data_cache.get(ctf_id)
+    if data:
+        base = _ctf_data_base.get(ctf_id)
+        if base is None or _file_signature(_ctf_filename(ctf_id)) != base[0]:
+            with _ctf_data_lock:
+                _merge_ctf_file(ctf_id, data)
+        return data
+    filename = _ctf_filename(ctf_id)
     try:
-        with open(filename, 'r') as f:
-            data = json.load(f)
-            _ctf_data_cache['ctf_id'] = ctf_id
-            _ctf_data_cache['data'] = data
+        data, signature = _read_ctf_file(ctf_id)
+        with _ctf_data_lock:
+            # Another request may have loaded it meanwhile: keep a single shared object
+            if ctf_id in _ctf_data_cache:
+                return _ctf_data_cache[ctf_id]
+            _ctf_data_cache[ctf_id] = data
+            _ctf_data_base[ctf_id] = (signature, {k: _digest(json.dumps(v)) for k, v in data.items()},
+                                      dict(data.get('details_versions') or {}))
             return data
     except FileNotFoundError:
         print(f"Error: CTF data file not found for ID {ctf_id}")
     except json.JSONDecodeError:
         print(f"Error: Could not decode JSON in file {filename}")
-    _ctf_data_cache['ctf_id'] = None
-    _ctf_data_cache['data'] = None
+    _ctf_data_cache.pop(ctf_id, None)
     return None
 
 def update_ctf_cache(ctf_id, ctf_data):
     """Updates the CTF data for a given CTF ID and saves it to a JSON file."""
-    global _ctf_data_cache
     try:
-        filename = os.path.join(DATA_DIR, f"ctf_{ctf_id}.json")
-        with open(filename, 'w') as f:
-            json.dump(ctf_data, f)
-        _ctf_data_cache['data'] = ctf_data
+        filename = _ctf_filename(ctf_id)
+        # Serialize writers (threads and processes), and never leave a half-written file behind
+        with _ctf_data_lock, _data_dir_lock():
+            # Keep what another process saved meanwhile (e.g. a sync next to the server)
+            _merge_ctf_file(ctf_id, ctf_data)
+            serialized = {k: json.dumps(v) for k, v in ctf_data.items()}
+            content = '{' + ', '.join(f"{json.dumps(k)}: {v}" for k, v in serialized.items()) + '}'
+            with open(filename + '.tmp', 'w') as f:
+                f.write(content)
+            previous = _file_signature(filename)
+            mtime = time.time_ns() if previous is None else max(time.time_ns(), previous[1] + 1000)
+            os.utime(filename + '.tmp', ns=(mtime, mtime))
+            os.replace(filename + '.tmp', filename)
+            _ctf_data_base[ctf_id] = (_file_signature(filename), {k: _digest(v) for k, v in serialized.items()},
+                                      dict(ctf_data.get('details_versions') or {}))
+            _ctf_data_cache[ctf_id] = ctf_data
         return True
     except Exception as e:
         print(f"Error: updating CTF #{ctf_id} cache: {e}")
-    _ctf_data_cache['data'] = None # Reset cache on failure
+    _ctf_data_cache.pop(ctf_id, None) # Reset cache on failure
+    _ctf_data_base.pop(ctf_id, None)
     return False
 
+def _is_team_secret(value):
+    return bool(value) and hmac.compare_digest(value.encode(), TEAM_SECRET.encode())
+
+@app.before_request
+def identify_user():
+    """In team mode, identifies the browser by a cookie (created on its first request)
+    and rejects CTF management requests without the team secret."""
+    if TEAM_MODE:
+        g.user_id = request.cookies.get(USER_COOKIE) or uuid.uuid4().hex
+        g.new_user = USER_COOKIE not in request.cookies
+        g.new_secret = _is_team_secret(request.args.get('secret'))
+        if request.endpoint in _TEAM_ADMIN_ENDPOINTS and not (
+                g.new_secret or _is_team_secret(request.cookies.get(TEAM_SECRET_COOKIE))):
+            return jsonify({'error': 'The team secret is required (open /?secret=<team secret> once).'}), 403
+
+@app.after_request
+def set_user_cookie(resp):
+    if TEAM_MODE and g.get('new_user'):
+        resp.set_cookie(USER_COOKIE, g.user_id, max_age=365 * 24 * 3600, samesite='Lax')
+    if TEAM_MODE and g.get('new_secret'):
+        resp.set_cookie(TEAM_SECRET_COOKIE, TEAM_SECRET, max_age=365 * 24 * 3600, httponly=True, samesite='Strict')
+    return resp
+
+def current_user():
+    """Returns the id of the current user in team mode, None otherwise."""
+    return g.get('user_id') if TEAM_MODE else None
+
+def _is_own_flag(flag):
+    """True if the current user can see and change a candidate flag. Outside team mode, every
+    flag. In team mode, the flags the user added, and the flags without an owner (saved
+    before team mode was used), which are shared by the whole team."""
+    if not TEAM_MODE:
+        return True
+    owner = flag.get('user')
+    return owner is None or owner == current_user()
+
+# Upstream response cache for CTFd GETs, keyed by (ctf_id, account, url).
+# (path regex, ttl, stale window) in seconds: a fresh entry is served as is, a stale one
+# is served while a background request revalidates it. Other URLs are never cached.
+# If that revalidation fails (e.g. 401, expired session), the next call fetches in the
+# foreground so the caller sees the error and can log in again.
+UPSTREAM_CACHE_DIR = os.path.join(DATA_DIR, 'http_cache')
+_UPSTREAM_TTLS = (
+    (re.compile(r"/api/v1/challenges$"), 15, 300),
+    (re.compile(r"/api/v1/challenges/\d+/solves$"), 30, 600),
+    (re.compile(r"/api/v1/challenges/\d+$"), 60, 600),
+)
+_upstream_cache = {'entries': {}, 'inflight': {}, 'lock': threading.Lock(),
+                   'stats': {'fresh': 0, 'stale': 0, 'miss': 0, 'bypass': 0}}
+
+class _CachedResponse:
+    """Minimal stand-in for requests.Response built from a cache entry."""
+    def __init__(self, entry):
+        self.status_code = entry['status']
+        self.text = entry['text']
+        self.ok = True
+    def json(self):
+        return json.loads(self.text)
+
+def _upstream_ttl(url):
+    path = url.split('?', 1)[0]
+    for pattern, ttl, stale in _UPSTREAM_TTLS:
+        if pattern.search(path):
+            return ttl, stale
+    return None
+
+def _upstream_cache_file(key):
+    ctf_id, account, url = key
+    digest = hashlib.sha1(f"{account}\n{url}".encode()).hexdigest()
+    return os.path.join(UPSTREAM_CACHE_DIR, str(ctf_id), f"{digest}.json")
+
+def _upstream_cache_lookup(key):
+    """Returns the cache entry for key from memory, or from disk on first access."""
+    entry = _upstream_cache['entries'].get(key)
+    if entry is None:
+        try:
+            with open(_upstream_cache_file(key), 'r') as f:
+                entry = json.load(f)
+            _upstream_cache['entries'][key] = entry
+        except (OSError, json.JSONDecodeError):
+            pass
+    return entry
+
+def _upstream_fetch(key, headers, timeout):
+    """Performs the GET for key and stores successful responses. Returns the response."""
+    r = requests.get(key[2], headers=headers, timeout=timeout)
+    if r.ok:
+        entry = {'status': r.status_code, 'text': r.text, 'time': time.time()}
+        with _upstream_cache['lock']:
+            _upstream_cache['entries'][key] = entry
+        try:
+            filename = _upstream_cache_file(key)
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, 'w') as f:
+                json.dump(entry, f)
+        except Exception as e:
+            print(f"Error: writing upstream cache: {e}")
+    return r
+
+def _upstream_revalidate(key, headers, timeout, done):
+    error = None
+    try:
+        r = _upstream_fetch(key, headers, timeout)
+        if not r.ok:
+            error = r.status_code
+    except Exception as e:
+        error = e
+    finally:
+        with _upstream_cache['lock']:
+            if error is not None:
+                print(f"[DBG] Background revalidation of {key[2]} failed: {error}")
+                # Do not serve the stale entry again: the next call fetches in the foreground
+                entry = _upstream_cache['entries'].get(key)
+                if entry:
+                    entry['failed'] = True
+            _upstream_cache['inflight'].pop(key, None)
+        done.set()
+
+def upstream_get(ctf_id, account, url, headers=None, timeout=60, revalidate=False):
+    """GET a CTFd URL through the upstream response cache (see _UPSTREAM_TTLS).
+    Concurrent requests for the same key share a single upstream fetch. With revalidate=True,
+    stale entries are never served: the call waits for an up-to-date response (used by sync)."""
+    ttls = _upstream_ttl(url)
+    if ttls is None:
+        with _upstream_cache['lock']:
+            _upstream_cache['stats']['bypass'] += 1
+        return requests.get(url, headers=headers, timeout=timeout)
+    ttl, stale = ttls
+    if revalidate:
+        stale = 0
+    key = (ctf_id, account, url)
+    while True:
+        with _upstream_cache['lock']:
+            entry = _upstream_cache_lookup(key)
+            age = time.time() - entry['time'] if entry else None
+            if entry and age < ttl:
+                _upstream_cache['stats']['fresh'] += 1
+                return _CachedResponse(entry)
+            inflight = _upstream_cache['inflight'].get(key)
+            if entry and age < ttl + stale and not entry.get('failed'):
+                _upstream_cache['stats']['stale'] += 1
+                if inflight is None:
+                    done = _upstream_cache['inflight'][key] = threading.Event()
+                    threading.Thread(target=_upstream_revalidate, args=(key, headers, timeout, done), daemon=True).start()
+                return _CachedResponse(entry)
+            if inflight is None:
+                done = _upstream_cache['inflight'][key] = threading.Event()
+                _upstream_cache['stats']['miss'] += 1
+                break
+        # Someone else is fetching this URL: wait for its result, then look again
+        if not inflight.wait(timeout):
+            with _upstream_cache['lock']:
+                _upstream_cache['stats']['bypass'] += 1
+            return requests.get(url, headers=headers, timeout=timeout)
+        with _upstream_cache['lock']:
+            entry = _upstream_cache['entries'].get(key)
+            if entry and time.time() - entry['time'] < ttl + stale and not entry.get('failed'):
+                _upstream_cache['stats']['fresh'] += 1
+                return _CachedResponse(entry)
+            # The shared fetch failed (e.g. 401): do our own
+            _upstream_cache['stats']['bypass'] += 1
+        return requests.get(url, headers=headers, timeout=timeout)
+    try:
+        return _upstream_fetch(key, headers, timeout)
+    finally:
+        with _upstream_cache['lock']:
+            _upstream_cache['inflight'].pop(key, None)
+        done.set()
+
+def invalidate_upstream_cache(ctf_id):
+    """Drops every cached upstream response of a CTF (e.g. after a solve)."""
+    with _upstream_cache['lock']:
+        for key in [k for k in _upstream_cache['entries'] if k[0] == ctf_id]:
+            del _upstream_cache['entries'][key]
+    shutil.rmtree(os.path.join(UPSTREAM_CACHE_DIR, str(ctf_id)), ignore_errors=True)
+
+@app.route('/upstream_cache', methods=['GET'])
+def get_upstream_cache_stats():
+    """Returns the upstream response cache counters and hit ratio."""
+    with _upstream_cache['lock']:
+        stats = dict(_upstream_cache['stats'])
+        stats['entries'] = len(_upstream_cache['entries'])
+    cacheable = stats['fresh'] + stats['stale'] + stats['miss']
+    stats['hit_ratio'] = round((stats['fresh'] + stats['stale']) / cacheable, 3) if cacheable else None
+    return jsonify(stats)
+
+def saved_ctf_ids():
+    """Returns the ids of the CTFs saved in DATA_DIR."""
+    ids = []
+    for filename in os.listdir(DATA_DIR):
+        if filename.startswith('ctf_') and filename.endswith('.json'):
+            try:
+                ids.append(int(filename[4:-5]))
+            except ValueError:
+                continue
+    return sorted(ids)
+
 @app.route('/ctfs', methods=['GET'])
 def list_ctfs():
     """Lists available saved CTFs and returns the last used login if available."""
@@ -84,7 +456,7 @@ def list_ctfs():
 def update_ctf_token(ctf_id):
     return jsonify({'error': 'Token update is not supported. Login/password are now used.'}), 400
 
-def fetch_challenge_list(url, login, password, ctf_data=None, ctf_id=None):
+def fetch_challenge_list(url, login, password, ctf_data=None, ctf_id=None, revalidate=False):
     """Fetches the challenge list from the remote CTFd API."""
     print(f"[DBG] Fetching challenge list for CTF @ {url}")
     token = ctf_data.get('token') if ctf_data else None
@@ -94,7 +466,7 @@ def fetch_challenge_list(url, login, password, ctf_data=None, ctf_id=None):
             return None, f"Could not fetch session token: {err}"
     headers = {'Cookie': f"session={token}"}
     try:
-        r = requests.get(f"{url}/api/v1/challenges", headers=headers, timeout=60)
+        r = upstream_get(ctf_id, login, f"{url}/api/v1/challenges", headers=headers, timeout=60, revalidate=revalidate)
         if not r.ok:
             # Try to refresh token if unauthorized
             if r.status_code == 401:
@@ -102,7 +474,7 @@ def fetch_challenge_list(url, login, password, ctf_data=None, ctf_id=None):
                 if not token:
                     return None, f"Could not fetch session token: {err}"
                 headers = {'Cookie': f"session={token}"}
-                r = requests.get(f"{url}/api/v1/challenges", headers=headers, timeout=60)
+                r = upstream_get(ctf_id, login, f"{url}/api/v1/challenges", headers=headers, timeout=60, revalidate=revalidate)
                 if not r.ok:
                     return None, f"CTFd API error: {r.status_code} {r.text}"
             else:
@@ -130,11 +502,17 @@ def get_challenges(ctf_id):
         if challenges is None or err_msg:
             return jsonify({'error': err_msg}), 404
         ctf_data['challenges'] = challenges
+        record_challenges_snapshot(ctf_id, challenges)
         if update_ctf_cache(ctf_id, ctf_data) == False:
             return jsonify({'error': 'Failed to update CTF data'}), 500
+    if TEAM_MODE:
+        # No CTFd credentials, and only the current user's candidate flags
+        public = {k: v for k, v in ctf_data.items() if k not in _SECRET_FIELDS}
+        public['flags'] = [f for f in ctf_data.get('flags', []) if _is_own_flag(f)]
+        return jsonify(public)
     return jsonify(ctf_data)
 
-def fetch_challenge(url, login, password, ctf_id, ch_id, ctf_data=None):
+def fetch_challenge(url, login, password, ctf_id, ch_id, ctf_data=None, revalidate=False):
     """Fetch details of a challenge from the remote CTFd API."""
     token = ctf_data.get('token') if ctf_data else None
     if not token:
@@ -144,7 +522,7 @@ def fetch_challenge(url, login, password, ctf_id, ch_id, ctf_data=None):
     headers = {'Cookie': f"session={token}"}
     print(f"[DBG] Fetching challenge #{ch_id} details for CTF @ {url}")
     try:
-        r = requests.get(f"{url}/api/v1/challenges/{ch_id}", headers=headers, timeout=60)
+        r = upstream_get(ctf_id, login, f"{url}/api/v1/challenges/{ch_id}", headers=headers, timeout=60, revalidate=revalidate)
         if r.ok:
             ch_full = r.json().get('data')
             if not ch_full:
@@ -156,7 +534,7 @@ def fetch_challenge(url, login, password, ctf_id, ch_id, ctf_data=None):
             if not token:
                 return None, f"Could not fetch session token: {err}"
             headers = {'Cookie': f"session={token}"}
-            r = requests.get(f"{url}/api/v1/challenges/{ch_id}", headers=headers, timeout=60)
+            r = upstream_get(ctf_id, login, f"{url}/api/v1/challenges/{ch_id}", headers=headers, timeout=60, revalidate=revalidate)
             if r.ok:
                 ch_full = r.json().get('data')
                 if not ch_full:
@@ -187,23 +565,13 @@ def get_challenge(ctf_id, chall_id):
     if refresh and url and login and password:
         ch, err_msg = fetch_challenge(url, login, password, ctf_id, chall_id, ctf_data)
         if ch and err_msg is None:
-            challenge = ctf_data.get('challenge', [])
-            found = False
-            for i, c in enumerate(challenge):
-                if str(c.get('id')) == str(chall_id):
-                    challenge[i] = ch
-                    found = True
-            if not found and ch.get('id') is not None:
-                challenge.append(ch)
-            ctf_data['challenge'] = challenge
+            _store_challenge_details(ctf_data, chall_id, ch)
             if update_ctf_cache(ctf_id, ctf_data) == False:
                 return jsonify({'error': 'Failed to update CTF data'}), 500
             # Fetch and cache solves after updating challenge cache
             _fetch_and_cache_challenge_solves(ctf_id, chall_id, ctf_data)
         else:
             return jsonify({'error': err_msg}), 404
-    # Extract hints from the challenge details (do not fetch from /hints endpoint)
-    # XXX: That may cause a problem if the challenge's hints get rewritten
     challenge_list = ctf_data.get('challenge', [])
     ch_obj = None
     for ch in challenge_list:
@@ -211,34 +579,166 @@ def get_challenge(ctf_id, chall_id):
         if str(ch.get('id')) == str(chall_id):
             ch_obj = ch
             break
-    # Attach cached hint content if available
-    hints = []
-    if ch_obj and 'hints' in ch_obj:
-        hint_contents = ctf_data.get('hint_contents', {})
-        chall_key = str(chall_id)
-        for h in ch_obj['hints']:
-            h_copy = h.copy()
-            if 'id' in h_copy and chall_key in hint_contents and str(h_copy['id']) in hint_contents[chall_key]:
-                h_copy['content'] = hint_contents[chall_key][str(h_copy['id'])]
-            hints.append(h_copy)
     # Always return hints for this challenge, even if challenge is not found
-    flags = [f for f in ctf_data.get('flags', []) if str(f.get('challenge_id')) == str(chall_id)]
+    hints = _challenge_hints(ctf_data, ch_obj, chall_id)
+    flags = [f for f in ctf_data.get('flags', []) if str(f.get('challenge_id')) == str(chall_id) and _is_own_flag(f)]
     if ch_obj:
         return jsonify({'challenge': ch_obj, 'flags': flags, 'hints': hints})
     else:
         # If challenge not found, still return hints and flags (challenge=None)
         return jsonify({'challenge': None, 'flags': flags, 'hints': hints, 'error': f"Challenge #{chall_id} not found in CTF #{ctf_id}"}), 404
 
+def _challenge_hints(ctf_data, ch_obj, chall_id):
+    """Returns the hints of a cached challenge with their cached content attached, if any."""
+    # Extract hints from the challenge details (do not fetch from /hints endpoint)
+    # XXX: That may cause a problem if the challenge's hints get rewritten
+    hints = []
+    if ch_obj and 'hints' in ch_obj:
+        chall_hints = ctf_data.get('hint_contents', {}).get(str(chall_id), {})
+        for h in ch_obj['hints']:
+            h_copy = h.copy()
+            if 'id' in h_copy and str(h_copy['id']) in chall_hints:
+                h_copy['content'] = chall_hints[str(h_copy['id'])]
+            hints.append(h_copy)
+    return hints
+
+def _store_challenge_details(ctf_data, chall_id, ch):
+    """Replaces (or adds) the cached details of a challenge."""
+    with _ctf_data_lock:
+        challenge = ctf_data.get('challenge') or []
+        found = False
+        for i, c in enumerate(challenge):
+            if str(c.get('id')) == str(chall_id):
+                challenge[i] = ch
+                found = True
+        if not found and ch.get('id') is not None:
+            challenge.append(ch)
+        ctf_data['challenge'] = challenge
+        _touch_challenge(ctf_data, chall_id)
+
+def _store_hint_content(ctf_data, chall_id, hint_id, content):
+    """Caches the content of a hint in ctf_data['hint_contents'][chall_id][hint_id]."""
+    with _ctf_data_lock:
+        ctf_data.setdefault('hint_contents', {}).setdefault(str(chall_id), {})[str(hint_id)] = content
+        _touch_challenge(ctf_data, chall_id)
+
+def _touch_challenge(ctf_data, chall_id):
+    """Bumps the details version of a challenge whose details, flags or hints changed (see /challenges/<ctf_id>/details)."""
+    with _ctf_data_lock:
+        version = ctf_data.get('details_version', 0) + 1
+        ctf_data['details_version'] = version
+        ctf_data.setdefault('details_versions', {})[str(chall_id)] = version
+
+@app.route('/challenges/<int:ctf_id>/details', methods=['GET'])
+def get_challenges_details(ctf_id):
+    """Returns every cached challenge detail with its flags and hints in one response.
+    With ?since=<version>, only the challenges changed after that version are returned."""
+    ctf_data = load_ctf_cache(ctf_id)
+    if ctf_data is None:
+        return jsonify({'error': f"CTF #{ctf_id} not found"}), 404
+    try:
+        since = int(request.args.get('since', -1))
+    except ValueError:
+        return jsonify({'error': 'Invalid since version'}), 400
+    versions = ctf_data.get('details_versions', {})
+    # Group flags by challenge in a single pass
+    flags_by_chall = {}
+    for f in ctf_data.get('flags', []):
+        if _is_own_flag(f):
+            flags_by_chall.setdefault(str(f.get('challenge_id')), []).append(f)
+    details = []
+    for ch in ctf_data.get('challenge') or []:
+        chall_key = str(ch.get('id'))
+        if versions.get(chall_key, 0) <= since:
+            continue
+        details.append({
+            'challenge': ch,
+            'flags': flags_by_chall.get(chall_key, []),
+            'hints': _challenge_hints(ctf_data, ch, chall_key),
+        })
+    return jsonify({'version': ctf_data.get('details_version', 0), 'challenges': details})
+
+# Frontend assets, compressed once and kept in memory: {path: (mtime, etag, {encoding: body})}
+_static_cache = {}
+# Rollup names bundles '[name]-[hash].js' (see rollup.config.js): their content never changes
+_HASHED_ASSET_RE = re.compile(r"-[0-9a-f]{8}\.[A-Za-z0-9]+$")
+_COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+# Optional (pip install brotli), imported when the first file is compressed: False if missing
+_brotli = None
+
+def _load_brotli():
+    global _brotli
+    if _brotli is None:
+        try:
+            import brotli
+            _brotli = brotli
+        except ImportError:
+            _brotli = False
+    return _brotli
+
+def _load_static(path):
+    """Returns (etag, mtime, {encoding: body}) for a frontend file, compressing it on first use."""
+    filename = safe_join(FRONTEND_DIR, path)
+    if filename is None or not os.path.isfile(filename):
+        return None
+    mtime = os.path.getmtime(filename)
+    cached = _static_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1], mtime, cached[2]
+    with open(filename, 'rb') as f:
+        body = f.read()
+    variants = {'identity': body}
+    mimetype = mimetypes.guess_type(filename)[0] or ''
+    if mimetype.startswith(_COMPRESSIBLE_TYPES) and len(body) > 1024:
+        variants['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+        brotli = _load_brotli()
+        if brotli:
+            variants['br'] = brotli.compress(body)
+    etag = hashlib.sha1(body).hexdigest()[:16]
+    _static_cache[path] = (mtime, etag, variants)
+    return etag, mtime, variants
+
+def _serve_static(path):
+    """Serves a frontend file, picking the best encoding allowed by Accept-Encoding.
+    Hashed bundles are cached forever, other files are revalidated with their ETag."""
+    static = _load_static(path)
+    if static is None:
+        abort(404)
+    etag, mtime, variants = static
+    if _HASHED_ASSET_RE.search(path):
+        cache_control = 'public, max-age=31536000, immutable'
+    else:
+        cache_control = 'no-cache'
+    encoding = 'identity'
+    # Range requests get the uncompressed file: byte ranges of a compressed body make no sense
+    if 'Range' not in request.headers:
+        for enc in ('br', 'gzip'):
+            if enc in variants and request.accept_encodings[enc]:
+                encoding = enc
+                break
+    resp = Response(variants[encoding], mimetype=mimetypes.guess_type(path)[0] or 'application/octet-stream')
+    if encoding != 'identity':
+        resp.headers['Content-Encoding'] = encoding
+    if len(variants) > 1:
+        resp.headers['Vary'] = 'Accept-Encoding'
+    resp.headers['Cache-Control'] = cache_control
+    resp.last_modified = mtime
+    # Each encoding is a distinct representation, so it gets its own ETag
+    resp.set_etag(etag if encoding == 'identity' else f"{etag}-{encoding}")
+    if encoding == 'identity':
+        return resp.make_conditional(request, accept_ranges=True, complete_length=len(variants[encoding]))
+    return resp.make_conditional(request)
+
 @app.route('/', methods=['GET'])
 def serve_frontend():
     """Serves the index.html file (Lit frontend)."""
-    return send_from_directory(FRONTEND_DIR, 'index.html')  # Serve index.html
+    return _serve_static('index.html')
 
 # Add a route for other static files in the frontend directory
 @app.route('/<path:path>')
 def serve_static(path):
     """Serves static files from the frontend directory."""
-    return send_from_directory(FRONTEND_DIR, path)
+    return _serve_static(path)
 
 def fetch_session_token(url, login, password, ctf_data=None, ctf_id=None):
     """Fetch session token from CTFd using login and password. If ctf_data and ctf_id are provided, update the cache if the token changes."""
@@ -249,9 +749,7 @@ def fetch_session_token(url, login, password, ctf_data=None, ctf_id=None):
         r = s.get(f"{url}/login", timeout=60)
         if not r.ok:
             return None, f"Failed to load login page: {r.status_code} {r.text}"
-        import re
-        # Updated regex: match both single and double quotes, allow whitespace/newlines
-        m = re.search(r"['\"]csrfNonce['\"]\s*:\s*['\"]([a-fA-F0-9]{64})['\"]", r.text)
+        m = _CSRF_NONCE_RE.search(r.text)
         if not m:
             return None, "Could not find csrfNonce in login page."
         csrf_nonce = m.group(1)
@@ -298,14 +796,7 @@ def create_ctf():
         return jsonify({'error': 'Login and password are required'}), 400
 
     # Assign a unique ID by finding the max existing ID and adding 1
-    existing_ids = []
-    for filename in os.listdir(DATA_DIR):
-        if filename.startswith('ctf_') and filename.endswith('.json'):
-            try:
-                existing_ids.append(int(filename[4:-5]))
-            except ValueError:
-                continue
-    ctf_id = max(existing_ids, default=-1) + 1
+    ctf_id = max(saved_ctf_ids(), default=-1) + 1
 
     # Fetch initial session token
     token, err = fetch_session_token(url, login, password)
@@ -329,9 +820,7 @@ def fetch_csrf_nonce(url, token):
         r = requests.get(f"{url}/", headers=headers, timeout=60)
         if not r.ok:
             return None, f"Error fetching the CSRF nonce: {r.status_code} {r.text}"
-        import re
-        # Use robust regex matching both single/double quotes and whitespace
-        m = re.search(r"['\"]csrfNonce['\"]\s*:\s*['\"]([a-fA-F0-9]{64})['\"]", r.text)
+        m = _CSRF_NONCE_RE.search(r.text)
         if m:
             csrf_nonce = m.group(1)
     except Exception as e:
@@ -349,7 +838,7 @@ def test_flag(ctf_id, chall_id, flag_id):
     if ctf_data is None:
         return jsonify({'error': 'CTF not found'}), 404
     flags = ctf_data.get('flags', [])
-    flag_obj = next((f for f in flags if f.get('challenge_id') == chall_id and f.get('id') == flag_id), None)
+    flag_obj = next((f for f in flags if f.get('challenge_id') == chall_id and f.get('id') == flag_id and _is_own_flag(f)), None)
     if not flag_obj:
         return jsonify({'error': f"Flag #{flag_id} for challenge #{chall_id} CTF #{ctf_id} not found"}), 404
     flag = flag_obj.get('submission')
@@ -397,19 +886,23 @@ def test_flag(ctf_id, chall_id, flag_id):
         if isinstance(data, list) and data:
             status = data[0].get('status')
             if status == 'correct':
-                flag_obj['state'] = 'valid'
-                # After a correct flag, force refresh the challenge list in the backend
-                # (Set a flag in ctf_data to trigger refresh on next /challenges/<ctf_id> call)
-                ctf_data['challenges'] = None
-            elif status == 'incorrect':
-                flag_obj['state'] = 'invalid'
-            # Update ctf_data['flags'] with the modified flag_obj
-            for i, f in enumerate(ctf_data.get('flags', [])):
-                if f.get('challenge_id') == chall_id and f.get('id') == flag_id:
-                    ctf_data['flags'][i] = flag_obj
-                    break
-            if update_ctf_cache(ctf_id, ctf_data) == False:
-                return jsonify({'success': False, 'error': 'Failed to update CTF data'}), 500
+                invalidate_upstream_cache(ctf_id)
+            with _ctf_data_lock:
+                if status == 'correct':
+                    flag_obj['state'] = 'valid'
+                    # After a correct flag, force refresh the challenge list in the backend
+                    # (Set a flag in ctf_data to trigger refresh on next /challenges/<ctf_id> call)
+                    ctf_data['challenges'] = None
+                elif status == 'incorrect':
+                    flag_obj['state'] = 'invalid'
+                # Update ctf_data['flags'] with the modified flag_obj
+                for i, f in enumerate(ctf_data.get('flags', [])):
+                    if f.get('challenge_id') == chall_id and f.get('id') == flag_id and _is_own_flag(f):
+                        ctf_data['flags'][i] = flag_obj
+                        break
+                _touch_challenge(ctf_data, chall_id)
+                if update_ctf_cache(ctf_id, ctf_data) == False:
+                    return jsonify({'success': False, 'error': 'Failed to update CTF data'}), 500
         return jsonify({'success': True, 'data': resp})
     except Exception as e:
         return jsonify({'success': False, 'error': f"Error submitting flag: {e}"}), 500
@@ -424,17 +917,23 @@ def add_candidate_flag(ctf_id, chall_id):
     ctf_data = load_ctf_cache(ctf_id)
     if ctf_data is None:
         return jsonify({'error': 'CTF not found'}), 404
-    # Check if the flag is already present for the challenge
-    flags = ctf_data.setdefault('flags', [])
-    for f in flags:
-        if f.get('challenge_id') == chall_id and f.get('submission', '').strip() == flag:
-            return jsonify({'error': 'Flag already exists for this challenge'}), 400
-    # Add the new flag for the challenge
-    flag_id = max([f.get('id', 0) for f in flags if f.get('challenge_id') == chall_id] + [-1]) + 1
-    flags.append({'id': flag_id, 'challenge_id': chall_id, 'submission': flag, 'state': 'untested'})
-    ctf_data['flags'] = flags
-    if not update_ctf_cache(ctf_id, ctf_data):
-        return jsonify({'error': 'Failed to update CTF data'}), 500
+    # Check, allocate the id and append atomically: teammates may add flags concurrently
+    with _ctf_data_lock:
+        # Check if the flag is already present for the challenge
+        flags = ctf_data.setdefault('flags', [])
+        for f in flags:
+            if f.get('challenge_id') == chall_id and f.get('submission', '').strip() == flag and _is_own_flag(f):
+                return jsonify({'error': 'Flag already exists for this challenge'}), 400
+        # Add the new flag for the challenge (ids are unique across users)
+        flag_id = max([f.get('id', 0) for f in flags if f.get('challenge_id') == chall_id] + [-1]) + 1
+        flag_obj = {'id': flag_id, 'challenge_id': chall_id, 'submission': flag, 'state': 'untested'}
+        if TEAM_MODE:
+            flag_obj['user'] = current_user()
+        flags.append(flag_obj)
+        ctf_data['flags'] = flags
+        _touch_challenge(ctf_data, chall_id)
+        if not update_ctf_cache(ctf_id, ctf_data):
+            return jsonify({'error': 'Failed to update CTF data'}), 500
     return jsonify({'success': True, 'flag_id': flag_id})
 
 @app.route('/remove_flag/<int:ctf_id>/<int:chall_id>', methods=['POST'])
@@ -447,15 +946,17 @@ def del_candidate_flag(ctf_id, chall_id):
     ctf_data = load_ctf_cache(ctf_id)
     if ctf_data is None:
         return jsonify({'error': 'CTF not found'}), 404
-    flags = ctf_data.get('flags', [])
-    # Find and remove the flag
-    for i, f in enumerate(flags):
-        if f.get('id') == flag_id and f.get('challenge_id') == chall_id:
-            del flags[i]
-            ctf_data['flags'] = flags
-            if update_ctf_cache(ctf_id, ctf_data) == False:
-                return jsonify({'error': 'Failed to update CTF data'}), 500
-            return jsonify({'success': True})
+    with _ctf_data_lock:
+        flags = ctf_data.get('flags', [])
+        # Find and remove the flag
+        for i, f in enumerate(flags):
+            if f.get('id') == flag_id and f.get('challenge_id') == chall_id and _is_own_flag(f):
+                del flags[i]
+                ctf_data['flags'] = flags
+                _touch_challenge(ctf_data, chall_id)
+                if update_ctf_cache(ctf_id, ctf_data) == False:
+                    return jsonify({'error': 'Failed to update CTF data'}), 500
+                return jsonify({'success': True})
     return jsonify({'error': 'Flag not found'}), 404
 
 @app.route('/delete_flags/<int:ctf_id>/<int:chall_id>', methods=['POST'])
@@ -464,16 +965,74 @@ def delete_flags(ctf_id, chall_id):
     ctf_data = load_ctf_cache(ctf_id)
     if ctf_data is None:
         return jsonify({'error': 'CTF not found'}), 404
-    flags = ctf_data.get('flags', [])
-    # Remove all flags for the given challenge
-    new_flags = [f for f in flags if f.get('challenge_id') != chall_id]
-    ctf_data['flags'] = new_flags
-    if not update_ctf_cache(ctf_id, ctf_data):
-        return jsonify({'error': 'Failed to update CTF data'}), 500
+    with _ctf_data_lock:
+        flags = ctf_data.get('flags', [])
+        # Remove all (own) flags for the given challenge
+        new_flags = [f for f in flags if f.get('challenge_id') != chall_id or not _is_own_flag(f)]
+        ctf_data['flags'] = new_flags
+        _touch_challenge(ctf_data, chall_id)
+        if not update_ctf_cache(ctf_id, ctf_data):
+            return jsonify({'error': 'Failed to update CTF data'}), 500
     return jsonify({'success': True, 'deleted': len(flags) - len(new_flags)})
 
-def _fetch_and_cache_challenge_solves(ctf_id, chall_id, ctf_data=None):
-    """Fetch and cache the list of users who solved a specific challenge from the remote CTFd server. Returns (solves, error_msg)."""
+# Compact solves cache: every solver is stored once in ctf_data['solve_accounts'] (solve dicts
+# without their date), and ctf_data['solves'][chall_id] = {'accounts': [index, ...], 'dates': [epoch, ...]}.
+# {ctf_id: (accounts table, {account key: index})}, rebuilt when the table object changes
+_solve_accounts_index = {}
+
+def _solve_account_key(account):
+    return json.dumps(account, sort_keys=True)
+
+def _date_to_epoch(date):
+    try:
+        # fromisoformat() only accepts a trailing 'Z' since Python 3.11
+        return int(datetime.fromisoformat(date.replace('Z', '+00:00')).timestamp())
+    except (AttributeError, ValueError):
+        return None
+
+def _epoch_to_date(epoch):
+    if epoch is None:
+        return None
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch))
+
+def _pack_solves(ctf_id, ctf_data, chall_id, solves):
+    """Stores the solves of a challenge (as returned by CTFd) in the compact representation."""
+    with _ctf_data_lock:  # The accounts table is shared by concurrent fetches
+        accounts = ctf_data.setdefault('solve_accounts', [])
+        cached = _solve_accounts_index.get(ctf_id)
+        if cached is None or cached[0] is not accounts:
+            cached = (accounts, {_solve_account_key(a): i for i, a in enumerate(accounts)})
+            _solve_accounts_index[ctf_id] = cached
+        index = cached[1]
+        packed = {'accounts': [], 'dates': []}
+        for solve in solves:
+            account = {k: v for k, v in solve.items() if k != 'date'}
+            key = _solve_account_key(account)
+            i = index.get(key)
+            if i is None:
+                i = index[key] = len(accounts)
+                accounts.append(account)
+            packed['accounts'].append(i)
+            packed['dates'].append(_date_to_epoch(solve.get('date')))
+        ctf_data.setdefault('solves', {})[str(chall_id)] = packed
+
+def _unpack_solves(ctf_data, chall_id):
+    """Rebuilds the solve dicts of a challenge from the compact representation."""
+    packed = (ctf_data.get('solves') or {}).get(str(chall_id))
+    if not packed:
+        return []
+    accounts = ctf_data.get('solve_accounts', [])
+    return [dict(accounts[i], date=_epoch_to_date(t)) for i, t in zip(packed['accounts'], packed['dates'])]
+
+def _compact_solves(ctf_id, ctf_data):
+    """Converts solves cached as lists of dicts (older data files) to the compact representation."""
+    for chall_key, solves in list((ctf_data.get('solves') or {}).items()):
+        if isinstance(solves, list):
+            _pack_solves(ctf_id, ctf_data, chall_key, solves)
+
+def _fetch_and_cache_challenge_solves(ctf_id, chall_id, ctf_data=None, save=True, revalidate=False):
+    """Fetch and cache the list of users who solved a specific challenge from the remote CTFd server.
+    Returns (compact solves, see _pack_solves, error_msg). With save=False, the caller saves ctf_data."""
     if ctf_data is None:
         ctf_data = load_ctf_cache(ctf_id)
     if ctf_data is None:
@@ -493,9 +1052,9 @@ def _fetch_and_cache_challenge_solves(ctf_id, chall_id, ctf_data=None):
             summary_solves = int(challenge_summary['solves'])
         except Exception:
             pass
-    cached_solves = solves.get(cache_key, [])
+    cached_solves = solves.get(cache_key) or {'accounts': [], 'dates': []}
     # Only fetch if the number of solves in summary does not match the cache length
-    if summary_solves is not None and len(cached_solves) == summary_solves:
+    if summary_solves is not None and len(cached_solves['accounts']) == summary_solves:
         return cached_solves, None
     token = ctf_data.get('token')
     if not token:
@@ -506,7 +1065,7 @@ def _fetch_and_cache_challenge_solves(ctf_id, chall_id, ctf_data=None):
     print(f"[DBG] Fetching solves for challenge #{chall_id} in CTF @ {url}")
     try:
         api_url = f"{url}/api/v1/challenges/{chall_id}/solves"
-        r = requests.get(api_url, headers=headers, timeout=60)
+        r = upstream_get(ctf_id, login, api_url, headers=headers, timeout=60, revalidate=revalidate)
         if not r.ok:
             # Try to refresh token if unauthorized
             if r.status_code == 401:
@@ -514,30 +1073,27 @@ def _fetch_and_cache_challenge_solves(ctf_id, chall_id, ctf_data=None):
                 if not token:
                     return None, f"Could not fetch session token: {err}"
                 headers = {'Cookie': f"session={token}"}
-                r = requests.get(api_url, headers=headers, timeout=60)
+                r = upstream_get(ctf_id, login, api_url, headers=headers, timeout=60, revalidate=revalidate)
                 if not r.ok:
                     return None, f"CTFd API error: {r.status_code} {r.text}"
             else:
                 return None, f"CTFd API error: {r.status_code} {r.text}"
         data = r.json()
-        solves = data.get('data', [])
         # Cache the solves in ctf_data
-        if 'solves' not in ctf_data:
-            ctf_data['solves'] = {}
-        ctf_data['solves'][cache_key] = solves
-        if update_ctf_cache(ctf_id, ctf_data) == False:
+        _pack_solves(ctf_id, ctf_data, chall_id, data.get('data', []))
+        if save and update_ctf_cache(ctf_id, ctf_data) == False:
             return None, 'Failed to update CTF data'
-        return solves, None
+        return ctf_data['solves'][cache_key], None
     except Exception as e:
         return None, f"Exception occurred: {e}"
 
 @app.route('/solves/<int:ctf_id>/<int:chall_id>', methods=['GET'])
 def get_challenge_solves(ctf_id, chall_id):
     """Fetch and cache the list of users who solved a specific challenge from the remote CTFd server."""
-    solves, err = _fetch_and_cache_challenge_solves(ctf_id, chall_id)
+    _, err = _fetch_and_cache_challenge_solves(ctf_id, chall_id)
     if err:
         return jsonify({'error': err}), 500 if 'Exception' in err or 'Failed' in err else 404
-    return jsonify({'solves': solves})
+    return jsonify({'solves': _unpack_solves(load_ctf_cache(ctf_id), chall_id)})
 
 @app.route('/ctfd_title', methods=['POST'])
 def get_ctfd_title():
@@ -552,8 +1108,7 @@ def get_ctfd_title():
         r = requests.get(url, timeout=15)
         if not r.ok:
             return jsonify({'error': f'Failed to fetch: {r.status_code}'}), 400
-        import re
-        m = re.search(r'<title>(.*?)</title>', r.text, re.IGNORECASE | re.DOTALL)
+        m = _TITLE_RE.search(r.text)
         if m:
             return jsonify({'title': m.group(1).strip()})
         else:
@@ -569,10 +1124,13 @@ def delete_ctf(ctf_id):
         if os.path.exists(filename):
             os.remove(filename)
             # Also clear cache if this was the cached CTF
-            global _ctf_data_cache
-            if _ctf_data_cache.get('ctf_id') == ctf_id:
-                _ctf_data_cache['ctf_id'] = None
-                _ctf_data_cache['data'] = None
+            _ctf_data_cache.pop(ctf_id, None)
+            _ctf_data_base.pop(ctf_id, None)
+            with _history_lock:
+                _history.pop(ctf_id, None)
+                if os.path.exists(_history_file(ctf_id)):
+                    os.remove(_history_file(ctf_id))
+            invalidate_upstream_cache(ctf_id)
             return jsonify({'success': True})
         else:
             return jsonify({'error': 'CTF not found'}), 404
@@ -617,15 +1175,11 @@ def get_hint_content(ctf_id, chall_id, hint_id):
     if not url or not login or not password:
         print(f"[ERR] CTF #{ctf_id} not found in cache")
         return jsonify({'error': 'Missing CTF credentials'}), 400
-    # Use a separate cache for hint contents
-    hint_contents = ctf_data.setdefault('hint_contents', {})
-    chall_key = str(chall_id)
-    hint_key = str(hint_id)
-    if chall_key not in hint_contents:
-        hint_contents[chall_key] = {}
-    # If content is already cached, return it
-    if hint_key in hint_contents[chall_key]:
-        return jsonify({'content': hint_contents[chall_key][hint_key]})
+    # If content is already cached (separate cache for hint contents), return it
+    with _ctf_data_lock:
+        cached = ctf_data.get('hint_contents', {}).get(str(chall_id), {}).get(str(hint_id))
+    if cached is not None:
+        return jsonify({'content': cached})
     # Fetch content from remote
     token = ctf_data.get('token')
     if not token:
@@ -658,8 +1212,7 @@ def get_hint_content(ctf_id, chall_id, hint_id):
         content = data.get('content') or data.get('description') or ''
         # If content is present, cache and return it
         if content:
-            hint_contents[chall_key][hint_key] = content
-            ctf_data['hint_contents'] = hint_contents
+            _store_hint_content(ctf_data, chall_id, hint_id, content)
             update_ctf_cache(ctf_id, ctf_data)
             return jsonify({'content': content})
         # If no content, try to unlock the hint
@@ -688,8 +1241,7 @@ def get_hint_content(ctf_id, chall_id, hint_id):
         data2 = r2.json().get('data', {})
         content2 = data2.get('content') or data2.get('description') or ''
         if content2:
-            hint_contents[chall_key][hint_key] = content2
-            ctf_data['hint_contents'] = hint_contents
+            _store_hint_content(ctf_data, chall_id, hint_id, content2)
             update_ctf_cache(ctf_id, ctf_data)
         return jsonify({'content': content2})
     except Exception as e:
@@ -703,26 +1255,453 @@ def get_user_challenges(ctf_id, user_id):
     ctf_data = load_ctf_cache(ctf_id)
     if ctf_data is None:
         return jsonify({'error': f"CTF #{ctf_id} not found"}), 404
-    challenges = ctf_data.get('challenges', [])
-    solves_cache = ctf_data.get('solves', {})
+    challenges = ctf_data.get('challenges') or []
+    solves_cache = ctf_data.get('solves') or {}
+    # Indexes of the user in the solve accounts table
+    user_accounts = {i for i, a in enumerate(ctf_data.get('solve_accounts', [])) if str(a.get('account_id')) == str(user_id)}
     solved_ids = []
     for ch in challenges:
         chall_id = ch.get('id')
-        solves = []
-        if str(chall_id) not in solves_cache:
-            continue
+        packed = solves_cache.get(str(chall_id))
         # Check if user_id is in solves
-        for solve in solves_cache[str(chall_id)]:
-            if str(solve.get('account_id')) == str(user_id):
-                solved_ids.append(chall_id)
-                break
+        if packed and not user_accounts.isdisjoint(packed['accounts']):
+            solved_ids.append(chall_id)
     return jsonify({'ctf_id': ctf_id, 'solved_ids': solved_ids})
 
+# History of the challenge list: data/history_<ctf_id>.jsonl is append-only, one line per
+# challenge and snapshot, holding only the fields that changed: {"t": epoch, "id": chall_id, "d": {field: value}}
+# ("d": null when a challenge disappears). In memory, per CTF:
+# {'state': {id: fields}, 'times': [t, ...], 'events': [(t, id, d), ...], 'by_chall': {id: [event index, ...]}}
+_history = {}
+_history_lock = threading.Lock()
+
+def _history_file(ctf_id):
+    return os.path.join(DATA_DIR, f"history_{ctf_id}.jsonl")
+
+def _history_add(hist, t, chall_id, delta):
+    if delta is None:
+        hist['state'].pop(chall_id, None)
+    else:
+        hist['state'].setdefault(chall_id, {}).update(delta)
+    hist['by_chall'].setdefault(chall_id, []).append(len(hist['events']))
+    hist['events'].append((t, chall_id, delta))
+    hist['times'].append(t)
+
+def _load_history(ctf_id):
+    """Returns the in-memory history of a CTF, reading its file on first use, then the lines
+    appended since by another process (e.g. a sync). Call with _history_lock held."""
+    hist = _history.get(ctf_id)
+    try:
+        size = os.path.getsize(_history_file(ctf_id))
+    except OSError:
+        size = 0
+    if hist is None or size < hist['size']:
+        # First use, or the file was deleted/rewritten: read it from the start
+        hist = {'state': {}, 'times': [], 'events': [], 'by_chall': {}, 'size': 0}
+        _history[ctf_id] = hist
+    if size > hist['size']:
+        with open(_history_file(ctf_id), 'rb') as f:
+            f.seek(hist['size'])
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Append in progress
+                hist['size'] += len(line)
+                try:
+                    e = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Interrupted append
+                _history_add(hist, e['t'], e['id'], e['d'])
+    return hist
+
+def record_challenges_snapshot(ctf_id, challenges):
+    """Appends to the history what changed in a freshly fetched challenge list."""
+    with _history_lock, _data_dir_lock():
+        hist = _load_history(ctf_id)
+        t = int(time.time())
+        lines = []
+        seen = set()
+        for ch in challenges:
+            chall_id = ch.get('id')
+            seen.add(chall_id)
+            old = hist['state'].get(chall_id, {})
+            delta = {k: v for k, v in ch.items() if k not in old or old[k] != v}
+            if delta:
+                _history_add(hist, t, chall_id, delta)
+                lines.append({'t': t, 'id': chall_id, 'd': delta})
+        for chall_id in [i for i in hist['state'] if i not in seen]:
+            _history_add(hist, t, chall_id, None)
+            lines.append({'t': t, 'id': chall_id, 'd': None})
+        if lines:
+            try:
+                with open(_history_file(ctf_id), 'ab') as f:
+                    f.write(''.join(json.dumps(line) + '\n' for line in lines).encode())
+                    hist['size'] = f.tell()
+            except Exception as e:
+                print(f"Error: updating CTF #{ctf_id} history: {e}")
+
+def _history_range():
+    """Parses the since/until query arguments (epoch seconds). Returns (since, until, error_msg)."""
+    bounds = []
+    for arg, default in (('since', float('-inf')), ('until', float('inf'))):
+        value = request.args.get(arg)
+        try:
+            bounds.append(default if value is None else int(value))
+        except ValueError:
+            return None, None, f"Invalid {arg} timestamp"
+    return bounds[0], bounds[1], None
+
+@app.route('/history/<int:ctf_id>', methods=['GET'])
+def get_history_changes(ctf_id):
+    """Everything that changed in the challenge list in a time range (?since=&until=, epoch seconds)."""
+    if not os.path.exists(_ctf_filename(ctf_id)):
+        return jsonify({'error': f"CTF #{ctf_id} not found"}), 404
+    since, until, err = _history_range()
+    if err:
+        return jsonify({'error': err}), 400
+    with _history_lock:
+        hist = _load_history(ctf_id)
+        start = bisect.bisect_right(hist['times'], since)
+        changes = []
+        for t, chall_id, delta in hist['events'][start:]:
+            if t > until:
+                break
+            changes.append({'t': t, 'id': chall_id, 'changes': delta})
+    return jsonify({'ctf_id': ctf_id, 'changes': changes})
+
+@app.route('/history/<int:ctf_id>/<int:chall_id>', methods=['GET'])
+def get_challenge_history(ctf_id, chall_id):
+    """Values of some fields of a challenge over time (?fields=value,solves&since=&until=).
+    One point per snapshot where one of these fields changed, with the full values at that time."""
+    fields = [f for f in request.args.get('fields', 'value,solves').split(',') if f]
+    if not os.path.exists(_ctf_filename(ctf_id)):
+        return jsonify({'error': f"CTF #{ctf_id} not found"}), 404
+    since, until, err = _history_range()
+    if err:
+        return jsonify({'error': err}), 400
+    with _history_lock:
+        hist = _load_history(ctf_id)
+        events = [hist['events'][i] for i in hist['by_chall'].get(chall_id, [])]
+    current = {}
+    series = []
+    for t, _, delta in events:
+        if t > until:
+            break
+        if delta is None:
+            current = {}
+            changed = True
+        else:
+            changed = any(f in delta for f in fields)
+            current.update(delta)
+        if changed and t > since:
+            series.append({'t': t, 'removed': delta is None, **{f: current.get(f) for f in fields}})
+    return jsonify({'ctf_id': ctf_id, 'id': chall_id, 'series': series})
+
+# Headless sync (./ctfd-helper.py sync): refresh the caches of saved CTFs without the web interface
+def _sync_challenge(ctf_id, ctf_data, chall_id, host_slots):
+    """Refreshes the details, solves and free hints of one challenge. Returns a counters dict."""
+    result = {'details': 0, 'solves': 0, 'hints': 0, 'errors': []}
+    url = ctf_data.get('url')
+    login = ctf_data.get('login')
+    password = ctf_data.get('password')
+    with host_slots:
+        ch, err = fetch_challenge(url, login, password, ctf_id, chall_id, ctf_data, revalidate=True)
+        if err:
+            result['errors'].append(err)
+            return result
+        _store_challenge_details(ctf_data, chall_id, ch)
+        result['details'] += 1
+        _, err = _fetch_and_cache_challenge_solves(ctf_id, chall_id, ctf_data, save=False, revalidate=True)
+        if err:
+            result['errors'].append(f"Solves of challenge #{chall_id}: {err}")
+        else:
+            result['solves'] += 1
+        # Free hints only: locked ones are never unlocked by a sync
+        for h in ch.get('hints') or []:
+            hint_key = str(h.get('id'))
+            with _ctf_data_lock:
+                cached = hint_key in ctf_data.get('hint_contents', {}).get(str(chall_id), {})
+            if h.get('cost') or cached:
+                continue
+            headers = {'Cookie': f"session={ctf_data.get('token')}"}
+            try:
+                r = upstream_get(ctf_id, login, f"{url}/api/v1/hints/{hint_key}", headers=headers, timeout=30)
+                if not r.ok:
+                    result['errors'].append(f"Hint #{hint_key}: CTFd API error: {r.status_code}")
+                    continue
+                data = r.json().get('data', {})
+            except Exception as e:
+                result['errors'].append(f"Hint #{hint_key}: {e}")
+                continue
+            content = data.get('content') or data.get('description')
+            if content:
+                _store_hint_content(ctf_data, chall_id, hint_key, content)
+                result['hints'] += 1
+    return result
+
+def _sync_ctf(ctf_id, challenge_pool, host_slots):
+    """Refreshes the challenge list, then every challenge of a CTF. Returns a summary dict."""
+    start = time.perf_counter()
+    summary = {'ctf_id': ctf_id, 'name': None, 'challenges': 0, 'details': 0, 'solves': 0, 'hints': 0, 'errors': []}
+    ctf_data = load_ctf_cache(ctf_id)
+    if ctf_data is None:
+        summary['errors'].append(f"CTF #{ctf_id} not found")
+        return summary
+    summary['name'] = ctf_data.get('name')
+    url = ctf_data.get('url')
+    login = ctf_data.get('login')
+    password = ctf_data.get('password')
+    if not url or not login or not password:
+        summary['errors'].append('Missing CTFd URL, login, or password')
+        return summary
+    slots = host_slots(url)
+    with slots:
+        challenges, err = fetch_challenge_list(url, login, password, ctf_data, ctf_id, revalidate=True)
+    if err:
+        summary['errors'].append(err)
+        return summary
+    ctf_data['challenges'] = challenges
+    record_challenges_snapshot(ctf_id, challenges)
+    summary['challenges'] = len(challenges)
+    futures = [challenge_pool.submit(_sync_challenge, ctf_id, ctf_data, ch.get('id'), slots) for ch in challenges]
+    for future in futures:
+        result = future.result()
+        for key in ('details', 'solves', 'hints'):
+            summary[key] += result[key]
+        summary['errors'].extend(result['errors'])
+    # Saved once for the whole CTF rather than after every challenge
+    if not update_ctf_cache(ctf_id, ctf_data):
+        summary['errors'].append('Failed to update CTF data')
+    summary['elapsed'] = time.perf_counter() - start
+    return summary
+
+def sync_ctfs(ctf_ids=None, jobs=4, per_host=4):
+    """Syncs the given CTFs (all saved ones by default), several CTFs at a time and at most
+    per_host concurrent requests to each CTFd host. Prints a summary, returns an exit status."""
+    from concurrent.futures import ThreadPoolExecutor
+    from urllib.parse import urlsplit
+    ctf_ids = ctf_ids or saved_ctf_ids()
+    if not ctf_ids:
+        print('No CTF to sync.')
+        return 0
+    slots = {}
+    slots_lock = threading.Lock()
+    def host_slots(url):
+        with slots_lock:
+            return slots.setdefault(urlsplit(url).netloc, threading.BoundedSemaphore(per_host))
+    stats_before = dict(_upstream_cache['stats'])
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=per_host * len(ctf_ids)) as challenge_pool, \
+         ThreadPoolExecutor(max_workers=jobs) as ctf_pool:
+        summaries = list(ctf_pool.map(lambda ctf_id: _sync_ctf(ctf_id, challenge_pool, host_slots), ctf_ids))
+    elapsed = time.perf_counter() - start
+    stats = {k: v - stats_before.get(k, 0) for k, v in _upstream_cache['stats'].items()}
+    failed = False
+    for summary in summaries:
+        print(f"CTF #{summary['ctf_id']} {summary['name'] or ''}: {summary['challenges']} challenges, "
+              f"{summary['details']} details, {summary['solves']} solves, {summary['hints']} free hints, "
+              f"{len(summary['errors'])} errors" + (f" in {summary['elapsed']:.1f}s" if 'elapsed' in summary else ''))
+        for err in summary['errors']:
+            print(f"  Error: {err}")
+        failed |= bool(summary['errors'])
+    print(f"Synced {len(summaries)} CTF(s) in {elapsed:.1f}s: {stats['miss'] + stats['bypass']} upstream requests "
+          f"(logins excluded), {stats['fresh'] + stats['stale']} served from the upstream cache")
+    return 1 if failed else 0
+
+# Similarity index (BM25) over the hackropole archive
+_TOKEN_RE = re.compile(r"[a-z0-9]{2,}")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_STOPWORDS = frozenset("""
+    the and for you are this that with from have not but can all your its was will
+    les des une est pour que qui dans par sur pas vous nous avec ces son ses aux
+    elle ont sont mais plus cette comme tout tous leur http https www com fcsc flag
+""".split())
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+# Field weights: a term in the title or tags counts more than one in the description
+_FIELD_WEIGHTS = (('title', 3), ('category', 2), ('tags', 2), ('description', 1))
+_similarity = {'index': None, 'docs': None, 'scored': None, 'lock': threading.Lock()}
+
+def _tokenize(text):
+    """Lowercases, strips accents and HTML tags, and splits text into index terms."""
+    text = _HTML_TAG_RE.sub(' ', text or '')
+    text = unicodedata.normalize('NFKD', text.lower()).encode('ascii', 'ignore').decode()
+    return [t for t in _TOKEN_RE.findall(text) if t not in _STOPWORDS]
+
+def _weighted_terms(fields):
+    """Returns {term: weighted frequency} for a dict of fields (see _FIELD_WEIGHTS)."""
+    tf = {}
+    for field, weight in _FIELD_WEIGHTS:
+        value = fields.get(field)
+        if isinstance(value, list):
+            value = ' '.join(value)
+        for t in _tokenize(value):
+            tf[t] = tf.get(t, 0) + weight
+    return tf
+
+def _update_similarity_index(index):
+    """Adds the records appended to the hackropole dump since the index was built.
+    Returns True if the index changed."""
+    try:
+        size = os.path.getsize(HACKROPOLE_DUMP)
+    except OSError:
+        return False
+    if index['dump_size'] > size:
+        # Dump was rewritten: start over
+        index.update({'dump_size': 0, 'docs': [], 'paths': {}, 'postings': {}})
+    if index['dump_size'] == size:
+        return False
+    docs, paths, postings = index['docs'], index['paths'], index['postings']
+    pos = index['dump_size']
+    with open(HACKROPOLE_DUMP, 'rb') as f:
+        f.seek(pos)
+        for line in f:
+            if not line.endswith(b'\n'):
+                break  # Partial record still being written
+            pos += len(line)
+            try:
+                ch = json.loads(line)
+                path = ch['path']
+            except (ValueError, KeyError):
+                continue
+            if path in paths:
+                # Re-appended challenge: drop the postings of its previous version
+                old = paths[path]
+                docs[old] = None
+                for term, plist in list(postings.items()):
+                    plist[:] = [p for p in plist if p[0] != old]
+                    if not plist:
+                        del postings[term]
+            doc_id = len(docs)
+            tf = _weighted_terms(ch)
+            docs.append({
+                'path': path,
+                'title': ch.get('title'),
+                'category': ch.get('category'),
+                'year': ch.get('year'),
+                'difficulty': ch.get('difficulty'),
+                'solutions_urls': ch.get('solutions_urls', []),
+                'len': sum(tf.values()),
+            })
+            paths[path] = doc_id
+            for term, n in tf.items():
+                postings.setdefault(term, []).append([doc_id, n])
+    index['dump_size'] = pos
+    return True
+
+def _score_similarity_index(index):
+    """Precomputes BM25 idf and per-posting weights so a query is a sum of lookups."""
+    live = [d for d in index['docs'] if d]
+    n_docs = len(live)
+    avgdl = (sum(d['len'] for d in live) / n_docs) if n_docs else 1.0
+    scored = {}
+    for term, plist in index['postings'].items():
+        idf = math.log(1 + (n_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+        scored[term] = [
+            (doc_id, idf * tf * (_BM25_K1 + 1) / (tf + _BM25_K1 * (1 - _BM25_B + _BM25_B * index['docs'][doc_id]['len'] / avgdl)))
+            for doc_id, tf in plist
+        ]
+    return scored
+
+def load_similarity_index():
+    """Lazily loads the on-disk similarity index, updating it if the hackropole dump grew.
+    Returns (docs, scored postings), or (None, None) if there is no dump. Both are
+    snapshots: a later update replaces them instead of changing them in place."""
+    with _similarity['lock']:
+        index = _similarity['index']
+        if index is None:
+            try:
+                with open(SIMILARITY_INDEX, 'r') as f:
+                    index = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                index = {'dump_size': 0, 'docs': [], 'paths': {}, 'postings': {}}
+        changed = _update_similarity_index(index)
+        if not index['paths']:
+            return None, None
+        if changed:
+            print(f"[DBG] Similarity index updated: {len(index['paths'])} archived challenges")
+            try:
+                with open(SIMILARITY_INDEX, 'w') as f:
+                    json.dump(index, f, separators=(',', ':'))
+            except Exception as e:
+                print(f"Error: saving similarity index: {e}")
+        if changed or _similarity['scored'] is None:
+            _similarity['docs'] = list(index['docs'])
+            _similarity['scored'] = _score_similarity_index(index)
+        _similarity['index'] = index
+        return _similarity['docs'], _similarity['scored']
+
+@app.route('/similar/<int:ctf_id>/<int:chall_id>', methods=['GET'])
+def get_similar_challenges(ctf_id, chall_id):
+    """Ranks archived hackropole challenges similar to a cached CTFd challenge."""
+    ctf_data = load_ctf_cache(ctf_id)
+    if ctf_data is None:
+        return jsonify({'error': f"CTF #{ctf_id} not found"}), 404
+    # Prefer the cached details (with description), fall back to the list summary
+    ch = next((c for c in ctf_data.get('challenge') or [] if str(c.get('id')) == str(chall_id)), None)
+    if ch is None:
+        ch = next((c for c in ctf_data.get('challenges') or [] if str(c.get('id')) == str(chall_id)), None)
+    if ch is None:
+        return jsonify({'error': f"Challenge #{chall_id} not found in CTF #{ctf_id}"}), 404
+    docs, scored = load_similarity_index()
+    if docs is None:
+        return jsonify({'error': f"No hackropole archive found ({HACKROPOLE_DUMP})"}), 404
+    try:
+        limit = max(1, min(int(request.args.get('limit', 10)), 100))
+    except ValueError:
+        limit = 10
+    query = _weighted_terms({'title': ch.get('name'), 'category': ch.get('category'),
+                             'tags': [t.get('value', '') if isinstance(t, dict) else str(t) for t in ch.get('tags') or []],
+                             'description': ch.get('description')})
+    scores = {}
+    for term, qtf in query.items():
+        for doc_id, weight in scored.get(term, ()):
+            scores[doc_id] = scores.get(doc_id, 0.0) + qtf * weight
+    best = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+    similar = []
+    for doc_id, score in best:
+        doc = docs[doc_id]
+        similar.append({
+            'path': doc['path'],
+            'url': HACKROPOLE_URL + doc['path'],
+            'title': doc['title'],
+            'category': doc['category'],
+            'year': doc['year'],
+            'difficulty': doc['difficulty'],
+            'solutions_urls': doc['solutions_urls'],
+            'score': round(score, 3),
+        })
+    return jsonify({'similar': similar})
+
 if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Alternative web client interface for CTFd.')
+    parser.add_argument('--team', action='store_true',
+                        help='serve the whole team over the LAN: shared challenge/solves caches, per-user candidate flags')
+    parser.add_argument('--team-secret',
+                        help='team secret required to add/delete CTFs and change credentials (default: random, printed at startup)')
+    parser.add_argument('--host', help='address to listen on (default: 127.0.0.1, 0.0.0.0 with --team)')
+    parser.add_argument('--port', type=int, default=5000)
+    subparsers = parser.add_subparsers(dest='command')
+    sync_parser = subparsers.add_parser('sync', help='refresh the caches of saved CTFs without starting the web interface')
+    sync_parser.add_argument('ctf_ids', nargs='*', type=int, help='CTF ids to sync (default: all saved CTFs)')
+    sync_parser.add_argument('-j', '--jobs', type=int, default=4, help='number of CTFs synced concurrently')
+    sync_parser.add_argument('--per-host', type=int, default=4, help='concurrent requests per CTFd host')
+    args = parser.parse_args()
+    if args.command == 'sync':
+        os.makedirs(DATA_DIR, exist_ok=True)
+        sys.exit(sync_ctfs(args.ctf_ids, args.jobs, args.per_host))
     if not os.path.isdir(FRONTEND_DIR):
         print('Error: cannot find the frontend directory.')
         sys.exit(1)
     # Create DATA_DIR if needed
     os.makedirs(DATA_DIR, exist_ok=True)
-    webbrowser.open('http://127.0.0.1:5000', new=1)
-    app.run(debug=False)
+    TEAM_MODE = args.team
+    TEAM_SECRET = args.team_secret or secrets.token_urlsafe(16)
+    host = args.host or ('0.0.0.0' if TEAM_MODE else '127.0.0.1')
+    if TEAM_MODE:
+        print(f"Team mode: share http://<this host>:{args.port} with your teammates")
+        print(f"To add/delete CTFs or change credentials, open http://<this host>:{args.port}/?secret={TEAM_SECRET} once")
+    else:
+        import webbrowser
+        webbrowser.open(f"http://127.0.0.1:{args.port}", new=1)
+    app.run(host=host, port=args.port, debug=False, threaded=True)
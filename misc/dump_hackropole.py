@@ -5,14 +5,12 @@
 import requests
 from bs4 import BeautifulSoup, Tag
 import re
-import json
 import logging
-import os
 from tqdm import tqdm
+from hackropole_store import DUMP_FILE, load_index, append_challenges
 
 BASE_URL = 'https://hackropole.fr'
 CHALLENGES_PATH = '/fr/challenges/'
-DUMP_FILE = 'hackropole_dump.json'
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
@@ -145,16 +143,11 @@ def fetch_challenge(path):
     }
 
 def update_dump(links):
-    """Merge fetched challenges into a single JSON dump file with uniform progress labels."""
-    # Load existing data
-    if os.path.exists(DUMP_FILE):
-        with open(DUMP_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    else:
-        data = {}
+    """Append newly fetched challenges to the JSONL dump file with uniform progress labels."""
+    index = load_index(DUMP_FILE)
 
     # Filter out already-fetched challenges
-    new_links = [p for p in links if p not in data]
+    new_links = [p for p in links if p not in index['offsets']]
     if not new_links:
         logging.info("No new challenge to fetch.")
         return
@@ -163,23 +156,20 @@ def update_dump(links):
     max_len = max(len(p) for p in new_links)
     fmt = f"{{:<{max_len}}}"  # fixed-width description
 
-    with tqdm(new_links, desc="Initializing", unit="item") as pbar:
-        for path in pbar:
-            pbar.set_description(fmt.format(path))
-            # Skip if the challenge is already dumped
-            if path in data:
-                continue
-            try:
-                ch = fetch_challenge(path)
-            except Exception as e:
-                logging.error(f"Failed to fetch {path}: {e}")
-                continue
-            data[path] = ch
-
-    # Write out
-    with open(DUMP_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    logging.info(f"Dump updated: {DUMP_FILE} has {len(data)} challenges.")
+    def fetched():
+        with tqdm(new_links, desc="Initializing", unit="item") as pbar:
+            for path in pbar:
+                pbar.set_description(fmt.format(path))
+                try:
+                    ch = fetch_challenge(path)
+                except Exception as e:
+                    logging.error(f"Failed to fetch {path}: {e}")
+                    continue
+                yield path, ch
+
+    # Each challenge is appended as soon as it is fetched (no full rewrite)
+    append_challenges(fetched(), DUMP_FILE, index)
+    logging.info(f"Dump updated: {DUMP_FILE} has {len(index['offsets'])} challenges.")
 
 def main():
     links = fetch_challenge_links()
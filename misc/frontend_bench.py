@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+"""Cold and warm UI load measurement for a running ctfd-helper.
+
+Cold load: index.html and every script it references, with an empty cache.
+Warm load: what a browser does on reload with a primed cache, i.e. skip assets
+still fresh per Cache-Control and revalidate the others with their ETag or
+Last-Modified. Reports transferred bytes and wall time for both.
+
+    ./frontend_bench.py [http://127.0.0.1:5000]"""
+
+import gzip
+import re
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ACCEPT_ENCODING = 'br, gzip' if brotli else 'gzip'
+SCRIPT_SRC_RE = re.compile(r"<script[^>]+src=['\"]?([^'\" >]+)", re.IGNORECASE)
+RUNS = 10
+
+def fetch(url, headers=None):
+    """Returns (status, headers, body length in bytes as transferred, decoded text or None)."""
+    req = urllib.request.Request(url, headers={'Accept-Encoding': ACCEPT_ENCODING, **(headers or {})})
+    try:
+        with urllib.request.urlopen(req) as r:
+            body = r.read()
+            encoding = r.headers.get('Content-Encoding')
+            raw = gzip.decompress(body) if encoding == 'gzip' else brotli.decompress(body) if encoding == 'br' else body
+            return r.status, r.headers, len(body), raw.decode('utf-8', 'replace')
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, e.headers, 0, None
+        raise
+
+def _fresh(headers):
+    """True if a browser would reuse the cached response without revalidating."""
+    cc = headers.get('Cache-Control', '')
+    m = re.search(r"max-age=(\d+)", cc)
+    return 'no-cache' not in cc and m is not None and int(m.group(1)) > 0
+
+def cold_load(base):
+    """Loads the UI with an empty cache. Returns (bytes, seconds, cache) where cache
+    maps url -> response headers for a subsequent warm load."""
+    start = time.perf_counter()
+    cache = {}
+    _, headers, total, html = fetch(base + '/')
+    cache[base + '/'] = headers
+    for src in SCRIPT_SRC_RE.findall(html):
+        url = base + '/' + src.lstrip('./').lstrip('/')
+        _, headers, n, _ = fetch(url)
+        cache[url] = headers
+        total += n
+    return total, time.perf_counter() - start, cache
+
+def warm_load(cache):
+    """Reloads the UI using validators and freshness from a cold load. Returns (bytes, seconds, requests)."""
+    start = time.perf_counter()
+    total = 0
+    requests = 0
+    for url, headers in cache.items():
+        if _fresh(headers):
+            continue
+        conditional = {}
+        if headers.get('ETag'):
+            conditional['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            conditional['If-Modified-Since'] = headers['Last-Modified']
+        _, _, n, _ = fetch(url, conditional)
+        total += n
+        requests += 1
+    return total, time.perf_counter() - start, requests
+
+def main():
+    base = (sys.argv[1] if len(sys.argv) > 1 else 'http://127.0.0.1:5000').rstrip('/')
+    cold, warm = [], []
+    for _ in range(RUNS):
+        c_bytes, c_time, cache = cold_load(base)
+        w_bytes, w_time, w_requests = warm_load(cache)
+        cold.append(c_time)
+        warm.append(w_time)
+    print(f"cold load: {c_bytes:>9} bytes  {len(cache)} requests  median {statistics.median(cold) * 1000:7.2f} ms")
+    print(f"warm load: {w_bytes:>9} bytes  {w_requests} requests  median {statistics.median(warm) * 1000:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
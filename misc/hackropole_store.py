@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""Append-only JSONL storage for the hackropole dump.
+
+Each line of the dump is one challenge object with an extra 'path' key
+(e.g. 'crypto/foo'). A small JSON side index maps every path to the byte
+offset and length of its line, so a single challenge can be read with one
+seek instead of parsing the whole archive. Adding a challenge is an append
+to the dump; only the (small) index is rewritten."""
+
+import json
+import logging
+import os
+import sys
+
+DUMP_FILE = 'hackropole_dump.jsonl'
+LEGACY_DUMP_FILE = 'hackropole_dump.json'
+
+def index_filename(dump_file=DUMP_FILE):
+    """Returns the offset index filename associated with a dump file."""
+    return dump_file + '.idx'
+
+def _scan(dump_file, offsets, start=0):
+    """Scans dump_file from byte 'start', recording path -> [offset, length] in offsets.
+    Returns the offset where the scan stopped (end of the last complete line)."""
+    pos = start
+    with open(dump_file, 'rb') as f:
+        f.seek(start)
+        for line in f:
+            if not line.endswith(b'\n'):
+                # Partial trailing line (interrupted append), ignore it
+                logging.warning(f"Ignoring truncated record at offset {pos} in {dump_file}")
+                break
+            if line.strip():
+                try:
+                    path = json.loads(line)['path']
+                except (ValueError, KeyError) as e:
+                    logging.warning(f"Skipping malformed record at offset {pos} in {dump_file}: {e}")
+                else:
+                    # Last occurrence wins, so a re-appended challenge replaces the old one
+                    offsets[path] = [pos, len(line)]
+            pos += len(line)
+    return pos
+
+def load_index(dump_file=DUMP_FILE):
+    """Loads the offset index of dump_file, extending or rebuilding it if the dump grew.
+    Returns {'size': <indexed bytes>, 'offsets': {path: [offset, length]}}."""
+    index = {'size': 0, 'offsets': {}}
+    if not os.path.exists(dump_file):
+        return index
+    try:
+        with open(index_filename(dump_file), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (FileNotFoundError, ValueError):
+        index = {'size': 0, 'offsets': {}}
+    size = os.path.getsize(dump_file)
+    if index.get('size', 0) > size:
+        # Dump was rewritten or truncated behind our back: rebuild from scratch
+        index = {'size': 0, 'offsets': {}}
+    if index['size'] < size:
+        index['size'] = _scan(dump_file, index['offsets'], index['size'])
+        save_index(index, dump_file)
+    return index
+
+def save_index(index, dump_file=DUMP_FILE):
+    """Writes the offset index next to dump_file."""
+    tmp = index_filename(dump_file) + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'))
+    os.replace(tmp, index_filename(dump_file))
+
+def iter_challenges(dump_file=DUMP_FILE):
+    """Yields (path, challenge) for every record of the dump, one line at a time.
+    If a path was appended several times, only its latest record is yielded."""
+    offsets = load_index(dump_file)['offsets']
+    with open(dump_file, 'rb') as f:
+        pos = 0
+        for line in f:
+            start, pos = pos, pos + len(line)
+            if not line.strip():
+                continue
+            try:
+                ch = json.loads(line)
+            except ValueError:
+                continue
+            path = ch.pop('path', None)
+            if path is None or offsets.get(path, [None])[0] != start:
+                continue
+            yield path, ch
+
+def get_challenge(path, dump_file=DUMP_FILE, index=None):
+    """Looks up a single challenge by path using the offset index. Returns None if absent."""
+    if index is None:
+        index = load_index(dump_file)
+    entry = index['offsets'].get(path)
+    if entry is None:
+        return None
+    offset, length = entry
+    with open(dump_file, 'rb') as f:
+        f.seek(offset)
+        ch = json.loads(f.read(length))
+    ch.pop('path', None)
+    return ch
+
+def append_challenges(items, dump_file=DUMP_FILE, index=None):
+    """Appends (path, challenge) pairs to the dump and updates the offset index.
+    Each record is flushed as it is written, so an interrupted run keeps what was fetched."""
+    if index is None:
+        index = load_index(dump_file)
+    if os.path.exists(dump_file) and os.path.getsize(dump_file) > index['size']:
+        # Drop a truncated trailing record so the next line starts cleanly
+        os.truncate(dump_file, index['size'])
+    count = 0
+    with open(dump_file, 'ab') as f:
+        pos = f.tell()
+        for path, ch in items:
+            line = json.dumps({'path': path, **ch}, ensure_ascii=False).encode('utf-8') + b'\n'
+            f.write(line)
+            f.flush()
+            index['offsets'][path] = [pos, len(line)]
+            pos += len(line)
+            index['size'] = pos
+            count += 1
+    save_index(index, dump_file)
+    return count
+
+def convert_legacy_dump(legacy_file=LEGACY_DUMP_FILE, dump_file=DUMP_FILE):
+    """Migrates a pretty-printed {path: challenge} JSON dump to the JSONL format.
+    Challenges already present in the JSONL dump are left untouched."""
+    with open(legacy_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    index = load_index(dump_file)
+    new_items = [(p, ch) for p, ch in data.items() if p not in index['offsets']]
+    count = append_challenges(new_items, dump_file, index)
+    logging.info(f"Converted {count} challenges from {legacy_file} to {dump_file} "
+                 f"({len(index['offsets'])} in total).")
+    return count
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    legacy_file = sys.argv[1] if len(sys.argv) > 1 else LEGACY_DUMP_FILE
+    dump_file = sys.argv[2] if len(sys.argv) > 2 else DUMP_FILE
+    convert_legacy_dump(legacy_file, dump_file)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""Memory and on-disk size of the cached solves, CTFd dicts vs compact representation.
+
+Generates a synthetic CTF (10k accounts by default) where each account solves a
+random subset of the challenges, then measures both representations of
+ctf_data['solves'] as stored by ctfd-helper.py.
+
+    ./solves_bench.py [accounts] [challenges] [solves per account]"""
+
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_helper():
+    spec = importlib.util.spec_from_file_location('ctfd_helper', os.path.join(REPO_DIR, 'ctfd-helper.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def generate(n_accounts, n_challenges, per_account):
+    """Returns {chall_id: [solve dicts]} shaped like /api/v1/challenges/<id>/solves."""
+    random.seed(0)
+    start = datetime(2025, 5, 1, tzinfo=timezone.utc)
+    solves = {str(c): [] for c in range(1, n_challenges + 1)}
+    for account_id in range(1, n_accounts + 1):
+        name = f"team-{account_id:05d}-{random.getrandbits(32):08x}"
+        for c in random.sample(range(1, n_challenges + 1), per_account):
+            date = start + timedelta(seconds=random.randrange(2 * 24 * 3600), microseconds=random.randrange(10**6))
+            solves[str(c)].append({
+                'account_id': account_id,
+                'name': name,
+                'date': date.isoformat().replace('+00:00', 'Z'),
+                'account_url': f"/users/{account_id}",
+            })
+    return solves
+
+def measure(build):
+    """Returns (object, bytes allocated while building it)."""
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+def main():
+    n_accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_challenges = int(sys.argv[2]) if len(sys.argv) > 2 else 150
+    per_account = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    helper = load_helper()
+    raw = json.dumps(generate(n_accounts, n_challenges, per_account))
+
+    # Before: solves kept as returned by CTFd
+    before, before_mem = measure(lambda: {'solves': json.loads(raw)})
+    before_disk = len(json.dumps(before))
+
+    # After: interned accounts + per-challenge arrays (as ctfd-helper.py stores them)
+    def build_compact():
+        data = {'solves': json.loads(raw)}
+        helper._compact_solves(0, data)
+        return data
+    after, after_mem = measure(build_compact)
+    after_disk = len(json.dumps(after))
+
+    t = time.perf_counter()
+    rebuilt = helper._unpack_solves(after, 1)
+    unpack_ms = (time.perf_counter() - t) * 1000
+    assert [s['account_id'] for s in rebuilt] == [s['account_id'] for s in before['solves']['1']]
+
+    n_solves = sum(len(v) for v in before['solves'].values())
+    print(f"{n_accounts} accounts, {n_challenges} challenges, {n_solves} solves")
+    print(f"{'':8} {'memory':>12} {'on disk':>12}")
+    print(f"{'before':8} {before_mem / 2**20:10.1f} MB {before_disk / 2**20:10.1f} MB")
+    print(f"{'after':8} {after_mem / 2**20:10.1f} MB {after_disk / 2**20:10.1f} MB")
+    print(f"rebuilding the dicts of one challenge ({len(rebuilt)} solves): {unpack_ms:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+"""Startup-time budget for ctfd-helper.
+
+Measures, for the script and optionally a Linux PyInstaller build:
+  - import time: loading ctfd-helper.py as a module in a fresh interpreter,
+  - time-to-first-response: from process spawn to the first successful GET /ctfs.
+Exits with status 1 if a median exceeds its budget.
+
+    ./startup_bench.py                      # script only (run from the repo root after 'npm run build')
+    ./startup_bench.py --pyinstaller        # also build and measure dist/ctfd-helper
+    ./startup_bench.py --binary ./ctfd-helper"""
+
+import argparse
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(REPO_DIR, 'ctfd-helper.py')
+FRONTEND_DIR = os.path.join(REPO_DIR, 'build')
+
+IMPORT_SNIPPET = """
+import importlib.util, time
+t = time.perf_counter()
+spec = importlib.util.spec_from_file_location('ctfd_helper', {script!r})
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+print(time.perf_counter() - t)
+"""
+
+def measure_import(runs):
+    """Returns the import times (ms) of ctfd-helper.py, each in a fresh interpreter."""
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', IMPORT_SNIPPET.format(script=SCRIPT)],
+                             capture_output=True, text=True, check=True, cwd=REPO_DIR)
+        times.append(float(out.stdout.strip().splitlines()[-1]) * 1000)
+    return times
+
+def _workdir():
+    """Creates a scratch directory with an empty data/ and the frontend build."""
+    tmp = tempfile.mkdtemp(prefix='ctfd-helper-bench-')
+    os.makedirs(os.path.join(tmp, 'data'))
+    if os.path.isdir(FRONTEND_DIR):
+        os.symlink(FRONTEND_DIR, os.path.join(tmp, 'build'))
+    return tmp
+
+def _free_port():
+    """Returns a TCP port nothing listens on, so the probe cannot reach another instance."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def measure_first_response(cmd, runs, timeout=30):
+    """Returns the times (ms) from spawning cmd (on a free --port) to its first 200 on GET /ctfs."""
+    env = dict(os.environ, BROWSER='true')  # webbrowser.open() runs a no-op command
+    times = []
+    for _ in range(runs):
+        tmp = _workdir()
+        port = _free_port()
+        probe_url = f"http://127.0.0.1:{port}/ctfs"
+        t = time.perf_counter()
+        proc = subprocess.Popen(cmd + ['--port', str(port)], cwd=tmp, env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while True:
+                if proc.poll() is not None:
+                    raise RuntimeError(f"{cmd[0]} exited with status {proc.returncode}")
+                if time.perf_counter() - t > timeout:
+                    raise RuntimeError(f"no response from {cmd[0]} after {timeout}s")
+                try:
+                    with urllib.request.urlopen(probe_url, timeout=1) as r:
+                        if r.status == 200:
+                            break
+                except OSError:
+                    time.sleep(0.005)
+            times.append((time.perf_counter() - t) * 1000)
+        finally:
+            proc.terminate()
+            proc.wait()
+            shutil.rmtree(tmp, ignore_errors=True)
+    return times
+
+def build_pyinstaller():
+    """Builds a Linux one-file binary with PyInstaller, returns its path."""
+    dist = os.path.join(REPO_DIR, 'dist')
+    subprocess.run(['pyinstaller', '--distpath', dist, '--workpath', os.path.join(tempfile.gettempdir(), 'ctfd-helper-pyi'),
+                    '--specpath', tempfile.gettempdir(), '--hidden-import', 'requests',
+                    f"--add-data={FRONTEND_DIR}:build", '--onefile', '--noconfirm', SCRIPT],
+                   check=True, cwd=REPO_DIR)
+    return os.path.join(dist, 'ctfd-helper')
+
+def report(label, times, budget):
+    """Prints a summary line and returns False if the median exceeds the budget (ms)."""
+    median = statistics.median(times)
+    ok = median <= budget
+    print(f"{label:<32} median {median:8.1f} ms  min {min(times):8.1f} ms  "
+          f"max {max(times):8.1f} ms  budget {budget:6.0f} ms  {'OK' if ok else 'OVER BUDGET'}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure ctfd-helper startup time against a budget.')
+    parser.add_argument('-n', '--runs', type=int, default=5)
+    parser.add_argument('--import-budget', type=float, default=400, help='script import time budget (ms)')
+    parser.add_argument('--response-budget', type=float, default=1000, help='script time-to-first-response budget (ms)')
+    parser.add_argument('--binary-budget', type=float, default=2500, help='binary time-to-first-response budget (ms)')
+    parser.add_argument('--binary', help='existing PyInstaller build to measure')
+    parser.add_argument('--pyinstaller', action='store_true', help='build a Linux PyInstaller binary and measure it')
+    args = parser.parse_args()
+
+    if not os.path.isdir(FRONTEND_DIR):
+        print("Error: cannot find the frontend directory (run 'npm run build').")
+        sys.exit(2)
+    ok = report('script import', measure_import(args.runs), args.import_budget)
+    ok &= report('script first response', measure_first_response([sys.executable, SCRIPT], args.runs), args.response_budget)
+    binary = build_pyinstaller() if args.pyinstaller else args.binary
+    if binary:
+        ok &= report('binary first response', measure_first_response([os.path.abspath(binary)], args.runs), args.binary_budget)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
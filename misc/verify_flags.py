@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+"""Offline flag verifier for archived hackropole challenges.
+
+Hashes candidate flags (one per line, from files or stdin) across a process
+pool and compares them with the 'flag_infos.hash' stored in the dump, so
+practice sessions do not need to submit anything on the website.
+
+    ./verify_flags.py crypto/foo candidates.txt
+    john --stdout ... | ./verify_flags.py crypto/foo -"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from hackropole_store import DUMP_FILE, get_challenge
+
+CHUNK_LINES = 50000
+# Hash algorithm guessed from the hex digest length
+HASH_ALGOS = {32: 'md5', 40: 'sha1', 64: 'sha256', 128: 'sha512'}
+
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
+# Worker state, set once per process by _init_worker
+_algo = None
+_hashes = None
+_case_insensitive = False
+
+def _init_worker(algo, hashes, case_insensitive):
+    global _algo, _hashes, _case_insensitive
+    _algo = algo
+    _hashes = hashes
+    _case_insensitive = case_insensitive
+
+def _check_chunk(lines):
+    """Hashes a chunk of raw candidate lines. Returns (number checked, matching flags)."""
+    matches = []
+    new = hashlib.new
+    for line in lines:
+        flag = candidate = line.rstrip(b'\r\n')
+        if _case_insensitive:
+            flag = flag.decode('utf-8', 'surrogateescape').lower().encode('utf-8', 'surrogateescape')
+        if new(_algo, flag).hexdigest() in _hashes:
+            matches.append(candidate.decode('utf-8', 'replace'))
+    return len(lines), matches
+
+def flag_hashes(flag_infos):
+    """Returns (algorithm, set of lowercase hex digests) from a challenge's flag_infos."""
+    raw = flag_infos.get('hash') or ''
+    hashes = {h.strip().lower() for h in raw.replace(',', ' ').split() if h.strip()}
+    if not hashes:
+        raise ValueError('no flag hash stored for this challenge')
+    lengths = {len(h) for h in hashes}
+    if len(lengths) != 1 or lengths.pop() not in HASH_ALGOS:
+        raise ValueError(f"unsupported flag hash format: {raw}")
+    return HASH_ALGOS[len(next(iter(hashes)))], hashes
+
+def read_chunks(sources, chunk_lines=CHUNK_LINES):
+    """Yields lists of raw lines from the given files ('-' for stdin)."""
+    for src in sources:
+        f = sys.stdin.buffer if src == '-' else open(src, 'rb')
+        try:
+            chunk = []
+            for line in f:
+                chunk.append(line)
+                if len(chunk) >= chunk_lines:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        finally:
+            if f is not sys.stdin.buffer:
+                f.close()
+
+def verify(path, sources, dump_file=DUMP_FILE, jobs=None, chunk_lines=CHUNK_LINES):
+    """Checks all candidates of sources against the archived challenge 'path'.
+    Returns (matches, number of candidates checked, elapsed seconds)."""
+    ch = get_challenge(path, dump_file)
+    if ch is None:
+        raise KeyError(f"challenge {path} not found in {dump_file}")
+    flag_infos = ch.get('flag_infos') or {}
+    algo, hashes = flag_hashes(flag_infos)
+    case_insensitive = bool(flag_infos.get('case_insensitive'))
+    logging.info(f"Checking candidates for {path} ({algo}, case {'in' if case_insensitive else ''}sensitive)")
+    matches = []
+    total = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(algo, hashes, case_insensitive)) as pool:
+        # Bound the number of chunks in flight so huge inputs are not read ahead into memory
+        max_pending = 4 * (jobs or os.cpu_count() or 1)
+        pending = []
+        for chunk in read_chunks(sources, chunk_lines):
+            pending.append(pool.submit(_check_chunk, chunk))
+            if len(pending) >= max_pending:
+                n, found = pending.pop(0).result()
+                total += n
+                matches.extend(found)
+        for fut in pending:
+            n, found = fut.result()
+            total += n
+            matches.extend(found)
+    return matches, total, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description='Check candidate flags offline against the hackropole dump.')
+    parser.add_argument('path', help="archived challenge path, e.g. 'crypto/foo'")
+    parser.add_argument('sources', nargs='*', default=['-'], help="candidate files, one flag per line ('-' for stdin)")
+    parser.add_argument('--dump', default=DUMP_FILE, help=f"JSONL dump file (default: {DUMP_FILE})")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--chunk-lines', type=int, default=CHUNK_LINES, help='candidates per work unit')
+    args = parser.parse_args()
+    try:
+        matches, total, elapsed = verify(args.path, args.sources, args.dump, args.jobs, args.chunk_lines)
+    except (KeyError, ValueError, OSError) as e:
+        logging.error(e)
+        sys.exit(2)
+    for flag in matches:
+        print(flag)
+    rate = total / elapsed if elapsed else 0
+    logging.info(f"{total} candidates checked in {elapsed:.2f}s ({rate:,.0f}/s), {len(matches)} match(es).")
+    sys.exit(0 if matches else 1)
+
+
+if __name__ == '__main__':
+    main()
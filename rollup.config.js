@@ -32,6 +32,9 @@ export default {
   ],
   output: {
     dir: 'build',
+    // Content-hashed bundle names: served with immutable cache headers by ctfd-helper.py
+    entryFileNames: '[name]-[hash].js',
+    chunkFileNames: '[name]-[hash].js',
   },
   preserveEntrySignatures: 'strict',
 };
@@ -78,6 +78,8 @@ export class CtfChallenges extends LitElement {
     this.selectedChallenge = null;
     this.updatingChallengeId = null;
     this.isLoading = false;
+    this.challengeDetails = {};
+    this.detailsVersion = undefined; // Version of the last /challenges/<ctf_id>/details response
     // Restore login from localStorage if available
     const loginLocal = localStorage.getItem('last-ctf-login');
     if (loginLocal) {
@@ -98,7 +100,12 @@ export class CtfChallenges extends LitElement {
       localStorage.removeItem('last-opened-ctf');
     }
     // Only call requestUpdate if value actually changed
-    if (this._ctfId !== oldVal) this.requestUpdate('ctfId', oldVal);
+    if (this._ctfId !== oldVal) {
+      // Cached details belong to the previous CTF
+      this.challengeDetails = {};
+      this.detailsVersion = undefined;
+      this.requestUpdate('ctfId', oldVal);
+    }
   }
 
   get ctfId() {
@@ -177,6 +184,7 @@ export class CtfChallenges extends LitElement {
       // Only clear challengeDetails on forceRefresh, not every fetch
       if (forceRefresh) {
         this.challengeDetails = {};
+        this.detailsVersion = undefined;
       
         // Group and sort challenges as in render
         const grouped = {};
@@ -236,6 +244,9 @@ export class CtfChallenges extends LitElement {
         // Final update in case some details failed
         this.ctfData.challenges = [...fetchOrder];
         this.requestUpdate();
+      } else {
+        // Details already cached by the backend: fetch them all in one request
+        await this.loadChallengeDetails(signal);
       }
 
 
@@ -295,6 +306,26 @@ export class CtfChallenges extends LitElement {
     setTimeout(() => this.loadChallenges(true), 0);
   }
 
+  async loadChallengeDetails(signal) {
+    // Only the challenges changed since the last call are returned
+    let url = `/challenges/${this.ctfId}/details`;
+    if (this.detailsVersion !== undefined) url += `?since=${this.detailsVersion}`;
+    const resp = await fetch(url, { signal });
+    if (!resp.ok) return;
+    const data = await resp.json();
+    for (const details of data.challenges || []) {
+      const ch = details.challenge;
+      if (!ch) continue;
+      this.challengeDetails[ch.id] = { ...ch, flags: details.flags || [], hints: details.hints || [] };
+      if (!this.hasUserName && typeof ch.solved_by_me !== 'undefined') {
+        const summary = (this.ctfData.challenges || []).find(c => c.id === ch.id);
+        if (summary) summary.solved_by_me = ch.solved_by_me;
+      }
+    }
+    this.detailsVersion = data.version;
+    this.requestUpdate();
+  }
+
   openChallenge(ch) {
     // Always fetch the latest details and flags from backend when opening a challenge
     this.selectedChallenge = { ...ch };